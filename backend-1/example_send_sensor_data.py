@@ -8,11 +8,24 @@ import requests
 import time
 import random
 import os
+import asyncio
+
+# aiohttp is optional - batch sending falls back to sequential requests
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # Configuration
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://localhost:4000')  # Change to your server IP
 SENSOR_ENDPOINT = f"{BACKEND_URL}/api/sensor/data"
 
+# Shared session so repeated requests reuse one pooled connection
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 def send_sensor_data(temperature, humidity):
     """
     Send temperature and humidity data to the backend
@@ -30,7 +43,7 @@ def send_sensor_data(temperature, humidity):
     }
     
     try:
-        response = requests.post(SENSOR_ENDPOINT, json=data, timeout=5)
+        response = SESSION.post(SENSOR_ENDPOINT, json=data, timeout=5)
         response.raise_for_status()  # Raise an exception for bad status codes
         result = response.json()
         print(f"✓ Success: Temp={temperature}°C, Humidity={humidity}%")
@@ -49,10 +62,54 @@ def send_sensor_data(temperature, humidity):
             print(f"  Details: {e.response.json()}")
         return None
 
+async def _send_async(session, temperature, humidity):
+    """Send one reading over a shared aiohttp session"""
+    data = {
+        "temperature": temperature,
+        "humidity": humidity
+    }
+    async with session.post(SENSOR_ENDPOINT, json=data,
+                            timeout=aiohttp.ClientTimeout(total=5)) as response:
+        response.raise_for_status()
+        result = await response.json()
+        print(f"✓ Success: Temp={temperature}°C, Humidity={humidity}%")
+        print(f"  Response: {result.get('message', 'Data saved')}")
+        return result
+
+def send_sensor_data_batch(readings):
+    """
+    Send many (temperature, humidity) readings concurrently
+
+    Fans the POSTs out with aiohttp over a pooled connection instead of
+    paying one round-trip per reading; falls back to the sequential
+    requests path when aiohttp is not installed.
+
+    Args:
+        readings (list): (temperature, humidity) tuples
+
+    Returns:
+        list: Server responses (None for failed readings)
+    """
+    if aiohttp is None:
+        return [send_sensor_data(t, h) for t, h in readings]
+
+    async def _run():
+        connector = aiohttp.TCPConnector(limit=8)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[_send_async(session, t, h) for t, h in readings],
+                return_exceptions=True)
+
+    results = asyncio.run(_run())
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"✗ Error: {result}")
+    return [r if not isinstance(r, Exception) else None for r in results]
+
 def get_all_sensor_data():
     """Get all sensor data from the backend"""
     try:
-        response = requests.get(SENSOR_ENDPOINT, timeout=5)
+        response = SESSION.get(SENSOR_ENDPOINT, timeout=5)
         response.raise_for_status()
         result = response.json()
         print(f"\n✓ Retrieved {result.get('count', 0)} sensor data entries")
@@ -65,7 +122,7 @@ def get_latest_sensor_data():
     """Get the latest sensor data entry"""
     try:
         url = f"{BACKEND_URL}/api/sensor/data/latest"
-        response = requests.get(url, timeout=5)
+        response = SESSION.get(url, timeout=5)
         response.raise_for_status()
         result = response.json()
         if result.get('success') and result.get('data'):
@@ -91,14 +148,11 @@ def main():
     print("\n[Example 1] Sending a single sensor reading...")
     send_sensor_data(25.5, 60.0)
     
-    # Example 2: Send multiple readings (simulating continuous monitoring)
-    print("\n[Example 2] Sending multiple readings (simulated)...")
-    for i in range(3):
-        # Simulate sensor readings (replace with actual sensor code)
-        temp = random.uniform(20, 30)
-        humidity = random.uniform(40, 80)
-        send_sensor_data(round(temp, 2), round(humidity, 2))
-        time.sleep(1)  # Wait 1 second between readings
+    # Example 2: Send multiple readings concurrently (simulated batch)
+    print("\n[Example 2] Sending multiple readings (batched)...")
+    readings = [(round(random.uniform(20, 30), 2), round(random.uniform(40, 80), 2))
+                for _ in range(3)]
+    send_sensor_data_batch(readings)
     
     # Example 3: Get all data
     print("\n[Example 3] Retrieving all sensor data...")
@@ -795,6 +795,80 @@ let gateTriggerTimestamp = null;
 let gateTriggerPlate = null;
 let gateTriggerExpiry = null; // When the trigger expires (10 seconds after being set)
 let gateTriggerReadAt = null; // When the trigger was last read (to keep it active for a few seconds)
+let gateTriggerWaiters = []; // Pending long-poll requests waiting for a trigger
+
+// Wake every held long-poll request (called when a new trigger is set)
+function notifyGateTriggerWaiters() {
+    const waiters = gateTriggerWaiters;
+    gateTriggerWaiters = [];
+    waiters.forEach(({ resolve, timer }) => {
+        clearTimeout(timer);
+        resolve();
+    });
+}
+
+// Hold until a trigger fires or the wait elapses
+function waitForGateTrigger(waitMs) {
+    return new Promise((resolve) => {
+        const waiter = { resolve, timer: null };
+        waiter.timer = setTimeout(() => {
+            gateTriggerWaiters = gateTriggerWaiters.filter(w => w !== waiter);
+            resolve();
+        }, waitMs);
+        gateTriggerWaiters.push(waiter);
+    });
+}
+
+// Evaluate (and age out) the current trigger state, returning the poll body
+function gateTriggerStatus() {
+    const now = new Date();
+
+    // Check if trigger has expired
+    if (gateTriggerFlag && gateTriggerExpiry && now > gateTriggerExpiry) {
+        console.log(`[GATE TRIGGER] Trigger expired for plate: ${gateTriggerPlate}`);
+        gateTriggerFlag = false;
+        gateTriggerTimestamp = null;
+        gateTriggerPlate = null;
+        gateTriggerExpiry = null;
+        gateTriggerReadAt = null;
+    }
+
+    // If trigger was read, keep it active for 3 seconds to allow multiple polls
+    if (gateTriggerFlag && gateTriggerReadAt) {
+        const timeSinceRead = now - gateTriggerReadAt;
+        if (timeSinceRead > 3000) { // 3 seconds after being read, clear it
+            console.log(`[GATE TRIGGER] Trigger cleared after being read (3 seconds passed) for plate: ${gateTriggerPlate}`);
+            gateTriggerFlag = false;
+            gateTriggerTimestamp = null;
+            gateTriggerPlate = null;
+            gateTriggerExpiry = null;
+            gateTriggerReadAt = null;
+        }
+    }
+
+    if (!gateTriggerFlag) {
+        return {
+            triggered: false,
+            message: 'No gate trigger active'
+        };
+    }
+
+    const response = {
+        triggered: true,
+        message: 'Gate should open',
+        plate: gateTriggerPlate,
+        timestamp: gateTriggerTimestamp,
+        expiresAt: gateTriggerExpiry
+    };
+
+    // Mark as read (but don't clear immediately - keep active for 3 seconds)
+    if (!gateTriggerReadAt) {
+        gateTriggerReadAt = new Date();
+        console.log(`[GATE TRIGGER] ✓ Trigger READ by Raspberry Pi for plate: ${response.plate} (will stay active for 3 seconds)`);
+    }
+
+    return response;
+}
 
 // Route to trigger gate (called by main.py when registered plate detected or payment verified)
 router.post('/trigger-gate', async (req, res) => {
@@ -810,6 +884,9 @@ router.post('/trigger-gate', async (req, res) => {
         
         console.log(`[GATE TRIGGER] ✓ Gate trigger ACTIVATED for plate: ${gateTriggerPlate}, Reason: ${reason || 'N/A'}`);
         console.log(`[GATE TRIGGER]   Trigger will expire at: ${gateTriggerExpiry.toISOString()}`);
+
+        // Release any long-poll requests waiting on this trigger
+        notifyGateTriggerWaiters();
         
         res.status(200).json({
             success: true,
@@ -825,57 +902,19 @@ router.post('/trigger-gate', async (req, res) => {
 });
 
 // Route to check gate trigger status (polled by Raspberry Pi)
+// Supports long-polling: ?wait=<seconds> (capped at 30) holds the response
+// until a trigger fires instead of requiring a poll every couple of seconds
 router.get('/trigger-gate', async (req, res) => {
     try {
-        const now = new Date();
-        
-        // Check if trigger has expired
-        if (gateTriggerFlag && gateTriggerExpiry && now > gateTriggerExpiry) {
-            console.log(`[GATE TRIGGER] Trigger expired for plate: ${gateTriggerPlate}`);
-            gateTriggerFlag = false;
-            gateTriggerTimestamp = null;
-            gateTriggerPlate = null;
-            gateTriggerExpiry = null;
-            gateTriggerReadAt = null;
-        }
-        
-        // If trigger was read, keep it active for 3 seconds to allow multiple polls
-        if (gateTriggerFlag && gateTriggerReadAt) {
-            const timeSinceRead = now - gateTriggerReadAt;
-            if (timeSinceRead > 3000) { // 3 seconds after being read, clear it
-                console.log(`[GATE TRIGGER] Trigger cleared after being read (3 seconds passed) for plate: ${gateTriggerPlate}`);
-                gateTriggerFlag = false;
-                gateTriggerTimestamp = null;
-                gateTriggerPlate = null;
-                gateTriggerExpiry = null;
-                gateTriggerReadAt = null;
-            }
-        }
-        
-        if (gateTriggerFlag) {
-            // Return trigger status
-            const response = {
-                triggered: true,
-                message: 'Gate should open',
-                plate: gateTriggerPlate,
-                timestamp: gateTriggerTimestamp,
-                expiresAt: gateTriggerExpiry
-            };
-            
-            // Mark as read (but don't clear immediately - keep active for 3 seconds)
-            if (!gateTriggerReadAt) {
-                gateTriggerReadAt = new Date();
-                console.log(`[GATE TRIGGER] ✓ Trigger READ by Raspberry Pi for plate: ${response.plate} (will stay active for 3 seconds)`);
-            }
-            
-            res.status(200).json(response);
-        } else {
-            // No trigger active
-            res.status(200).json({
-                triggered: false,
-                message: 'No gate trigger active'
-            });
+        const waitSeconds = Math.min(Math.max(parseInt(req.query.wait, 10) || 0, 0), 30);
+
+        let status = gateTriggerStatus();
+        if (!status.triggered && waitSeconds > 0) {
+            await waitForGateTrigger(waitSeconds * 1000);
+            status = gateTriggerStatus();
         }
+
+        res.status(200).json(status);
     } catch (error) {
         console.error('Gate trigger check error:', error);
         res.status(500).json({ message: error.message });
@@ -14,11 +14,17 @@ import imutils
 import time
 import platform
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
 from datetime import datetime
 import threading
-from queue import Queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, SimpleQueue, Empty, Full
+import logging
+from logging.handlers import QueueHandler, QueueListener
 import re
+import signal
 import webbrowser
 from urllib.parse import urlencode
 import os
@@ -27,10 +33,64 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Deletion table covering every Latin-1 character that cannot appear on an
+# Indian plate - one C-level translate pass replaces two regex substitutions
+_PLATE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+_PLATE_TRANS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(256)) if c not in _PLATE_CHARS))
+
+
+# Drawing constants hoisted out of the frame loop - one attribute lookup
+# and tuple build apiece instead of per-frame reconstruction
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_CYAN = (0, 255, 255)
+_YELLOW = (255, 255, 0)
+_ORANGE = (0, 165, 255)
+_GRAY = (128, 128, 128)
+_GREEN = (0, 255, 0)
+
+
+# Compiled once so the OCR hot loop skips re's per-call cache lookup
+_PLATE_RE = re.compile(r'^[A-Z]{2}\d{2}[A-Z]{2,3}\d{4}$')
+
+
+# Detection-thread messages go through a queue and a background listener
+# drains them to stdout, so the hot path pays a lock-free put instead of a
+# blocking tty write per line (the default handler keeps print-style output)
+_log_queue = SimpleQueue()
+_plate_log = logging.getLogger('plate')
+_plate_log.setLevel(logging.INFO)
+_plate_log.addHandler(QueueHandler(_log_queue))
+_plate_log.propagate = False
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+
+def _matches_plate_format(text):
+    """Positional check for XX##XX#### / XX##XXX#### without regex
+
+    A fixed 10/11-char grammar doesn't need the regex engine - walking the
+    positions directly is a handful of C-level isalpha/isdigit calls per
+    candidate and avoids per-call pattern dispatch in the OCR hot loop."""
+    n = len(text)
+    if n not in (10, 11):
+        return False
+    series_end = n - 4  # 2-letter series for old format, 3 for new
+    return (text[:2].isalpha() and text[2:4].isdigit() and
+            text[4:series_end].isalpha() and text[series_end:].isdigit())
+
+
+def _dhash64(gray):
+    """64-bit difference hash (dHash) of a grayscale image"""
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    diff = small[:, 1:] > small[:, :-1]
+    return int(np.packbits(diff).view(np.uint64)[0])
+
 class LicensePlateDetector:
-    def __init__(self, api_url=None):
+    def __init__(self, api_url=None, verbose=False):
         """Initialize the license plate detector"""
         print("Initializing Enhanced License Plate Detector...")
+        self.verbose = verbose  # Multi-line per-detection terminal output
         
         # API endpoint - use environment variable or parameter or default
         if api_url is None:
@@ -39,47 +99,176 @@ class LicensePlateDetector:
         else:
             self.api_url = api_url
         print(f"API Endpoint: {self.api_url}")
-        
+
+        # Let OpenCV use all cores for its filter kernels, and allow the
+        # OpenCL backend where the build/driver supports it
+        cv2.setNumThreads(max(2, os.cpu_count() or 1))
+        try:
+            cv2.ocl.setUseOpenCL(True)
+        except cv2.error:
+            pass
+
+        # Reuse one pooled session for all backend calls - avoids a fresh
+        # TCP (and TLS) handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Queue for async API requests
         self.api_queue = Queue()
         self.api_thread = None
         self.stop_api_thread = False
+
+        # Queue for the plate-handling worker - detection only enqueues the
+        # plate text, the database/payment/gate HTTP calls run off-thread
+        self.plate_queue = Queue()
+        self.plate_thread = None
+        self.stop_plate_thread = False
+
+        # Detection worker state - the capture loop hands frames to a
+        # dedicated thread via a single-slot queue (latest frame wins) and
+        # draws whatever the worker last found
+        self.detect_queue = Queue(maxsize=1)
+        self.detect_thread = None
+        self.stop_detect_thread = False
+
+        # Capture worker state - the camera is serviced by its own thread
+        # so sensor/driver latency overlaps with detection and display
+        self.capture_queue = Queue(maxsize=1)
+        self.capture_thread = None
+        self.stop_capture_thread = False
+
+        # Display worker state - rendering gets its own thread and 1-slot
+        # queue too, so imshow/waitKey compositing never blocks capture.
+        # The last key pressed is published through a plain attribute
+        # (single-opcode reads/writes are atomic under the GIL)
+        self.display_queue = Queue(maxsize=1)
+        self.display_thread = None
+        self.stop_display_thread = False
+        self.last_key = 255  # 255 = no key pending
+        self.latest_result = None
+        self.latest_result_lock = threading.Lock()
+
+        # Motion gate state - lets static frames skip the whole pipeline
+        self._last_thumb = None
+        self._last_detection = None
+
+        # LRU cache of OCR results keyed by a perceptual hash of the ROI, so
+        # the same plate seen across consecutive frames is only OCR'd once
+        self._ocr_cache = OrderedDict()
+
+        # Plates whose API send recently failed, mapped to when they may retry
+        self._send_cooldown = {}
+
+        # Short-TTL caches for the per-detection backend lookups, plus a
+        # debounce so a plate sitting in view doesn't re-run the whole flow
+        # many times a second
+        self._db_cache = {}    # {plate_text: (exists, checked_at)}
+        self._paid_cache = {}  # {plate_text: (paid, checked_at)}
+        self._last_seen = {}   # {plate_text: last handle_plate_detection time}
+
+        # Small pool for overlapping the independent whitelist/paid lookups
+        self._lookup_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Cached status-text overlay (re-rasterized only when values change)
+        self._overlay = None
+        self._overlay_key = None
         
         # Track sent plates with timestamps for time-based duplicate prevention (optional)
         # Changed: Allow same plate to be detected multiple times, but prevent rapid duplicates (within 2 seconds)
+        # Single-opcode dict operations (get/set/len/clear) are atomic under
+        # the GIL, so no lock is needed around this map
         self.sent_plates = {}  # {plate_text: timestamp} - track when plate was last processed
-        self.sent_plates_lock = threading.Lock()
         self.DUPLICATE_COOLDOWN = 2  # seconds - minimum time between same plate detections
+
+        # Bloom filter fronting sent_plates: two bit probes answer the
+        # common "never sent" case without hashing the string into the
+        # dict; the dict stays the source of truth for "maybe" answers
+        self._sent_bloom = bytearray(self.BLOOM_BITS // 8)
         
         # Track plates being processed for payment
-        self.pending_payments = {}  # {plate_text: order_id}
+        self.pending_payments = {}  # {plate_text: {'order_id', 'attempts'}}
         self.pending_payments_lock = threading.Lock()
+        self._poll_thread = None  # singleton payment-polling scheduler
         
         # Base API URL
         self.base_api_url = api_url.replace('/api/numbers/numbers', '')
         
         # Indian state codes (all valid 2-letter state codes)
-        self.indian_state_codes = {
+        self.indian_state_codes = frozenset({
             'AP', 'AR', 'AS', 'BR', 'CG', 'DL', 'GA', 'GJ', 'HR', 'HP',
             'JH', 'JK', 'KA', 'KL', 'LD', 'MH', 'ML', 'MN', 'MP', 'MZ',
             'NL', 'OD', 'PB', 'PY', 'RJ', 'SK', 'TN', 'TR', 'TS', 'UP',
             'UK', 'WB', 'AN', 'CH', 'DN', 'DD', 'LA'
-        }
-        
-        # Initialize EasyOCR reader with better settings for Indian plates
+        })
+
+        # Flat 26x26 membership table - the state-code check sits inside
+        # clean_text's OCR-fixup loops, and two ord() subtractions plus a
+        # list index beat hashing a fresh 2-char string every probe
+        self._state_code_tbl = [False] * 676
+        for code in self.indian_state_codes:
+            self._state_code_tbl[(ord(code[0]) - 65) * 26 + (ord(code[1]) - 65)] = True
+        
+        # Cached CLAHE instance and reusable scratch buffers so the per-frame
+        # pipeline does not re-allocate parameter objects or image planes
+        self.clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8, 8))
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+        self._scratch_bufs = {}
+
+        self.is_raspberry_pi = self._is_raspberry_pi()
+
+        # Initialize EasyOCR reader with better settings for Indian plates.
+        # Use the GPU when CUDA is available (never on a Pi, which has none);
+        # on CPU keep the int8 dynamically-quantized models - roughly half
+        # the memory traffic of FP32
         print("Loading OCR model (this may take a moment)...")
-        self.reader = easyocr.Reader(['en'], gpu=False, model_storage_directory='./models')
-        
+        use_gpu = False
+        if not self.is_raspberry_pi:
+            try:
+                import torch
+                mps = getattr(torch.backends, 'mps', None)
+                use_gpu = torch.cuda.is_available() or (mps is not None and
+                                                        mps.is_available())
+            except ImportError:
+                pass
+        print(f"OCR backend: {'GPU' if use_gpu else 'CPU (int8 quantized)'}")
+        self.reader = easyocr.Reader(['en'], gpu=use_gpu, quantize=not use_gpu,
+                                     cudnn_benchmark=use_gpu,
+                                     model_storage_directory='./models')
+
+        # Warm the models up on a dummy image (and let cudnn benchmark pick
+        # its kernels) so the first real frame does not absorb that cost
+        try:
+            self.reader.readtext(np.zeros((64, 256, 3), dtype=np.uint8))
+        except Exception:
+            pass
+
+        # If an ONNX export of the recognizer is available, serve it through
+        # ONNX Runtime instead of PyTorch eager mode (2-3x faster on CPU)
+        if not use_gpu:
+            try:
+                from onnx_reader import OnnxPlateReader
+                if OnnxPlateReader.available():
+                    self.reader = OnnxPlateReader(self.reader.converter.character)
+                    print("OCR backend: ONNX Runtime (models/crnn.onnx)")
+            except Exception as e:
+                print(f"ONNX recognizer unavailable, keeping EasyOCR: {e}")
+
         # Initialize camera based on platform
         print("Initializing camera...")
-        self.is_raspberry_pi = self._is_raspberry_pi()
-        
+
         if self.is_raspberry_pi:
             try:
                 from picamera2 import Picamera2
                 self.picam2 = Picamera2()
                 config = self.picam2.create_preview_configuration(
-                    main={"size": (640, 480)}  # Lower resolution for speed
+                    # Lower resolution for speed; BGR888 delivers frames in
+                    # OpenCV's channel order so no per-frame conversion needed
+                    main={"size": (640, 480), "format": "BGR888"},
+                    # Detection takes >66ms anyway, so 15fps keeps frames fresh
+                    controls={"FrameRate": 15}
                 )
                 self.picam2.configure(config)
                 self.picam2.start()
@@ -92,60 +281,150 @@ class LicensePlateDetector:
                 self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
                 self.picam2 = None
         else:
-            # Use regular webcam for PC with moderate resolution
+            # Use regular webcam for PC with moderate resolution; a 1-frame
+            # driver buffer and 15fps keep capture close to real time since
+            # detection cannot keep up with 30fps anyway
             self.camera = cv2.VideoCapture(0)
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.camera.set(cv2.CAP_PROP_FPS, 30)
+            self.camera.set(cv2.CAP_PROP_FPS, 15)
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             self.picam2 = None
             print("Using PC Webcam")
         
         time.sleep(2)  # Allow camera to warm up
         print("Initialization complete!\n")
     
+    # Batching for bursty detections - amortizes one HTTP round-trip over
+    # everything queued within a short window
+    MAX_BATCH = 32
+    BATCH_WINDOW = 0.05  # seconds to wait for more items before flushing
+
+    # Mean absolute thumbnail difference below which a frame counts as static
+    MOTION_THRESHOLD = 3.0
+
+    # Maximum entries kept in the perceptual-hash OCR cache
+    OCR_CACHE_SIZE = 256
+
+    # How long database/payment lookups stay valid, and the minimum gap
+    # between full plate-handling runs for the same plate
+    DB_CACHE_TTL = 30  # seconds
+    PLATE_DEBOUNCE = 1.0  # seconds
+
+    # Size of the sent-plate bloom filter (bits; power of two)
+    BLOOM_BITS = 1 << 17
+
+    # Retry/backoff policy for failed API posts
+    SEND_RETRY_ATTEMPTS = 3
+    SEND_FAILURE_COOLDOWN = 30  # seconds before a failed plate may re-queue
+
+    # Characters EasyOCR may emit for a plate
+    OCR_ALLOWLIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
     def _api_worker(self):
         """Background thread worker for processing API requests"""
         print("API worker thread started")
-        
+
         while not self.stop_api_thread:
+            # Block on the queue instead of polling - wakes immediately when
+            # an item arrives and only periodically to re-check the stop flag
             try:
-                if not self.api_queue.empty():
-                    data = self.api_queue.get(timeout=1)
-                    
-                    try:
-                        response = requests.post(
-                            self.api_url,
-                            json=data,
-                            headers={"Content-Type": "application/json"},
-                            timeout=5
-                        )
-                        
-                        if response.status_code in [200, 201]:
-                            print(f"✓ Data sent successfully to API")
-                            print(f"  Response: {response.text}")
-                            
-                            # Mark as successfully sent (with timestamp)
-                            with self.sent_plates_lock:
-                                self.sent_plates[data['numberPlate']] = time.time()
-                        else:
-                            print(f"✗ API Error: Status code {response.status_code}")
-                            # Don't add to sent_plates if failed, allow retry
-                            
-                    except requests.exceptions.Timeout:
-                        print("✗ API Error: Request timeout")
-                    except requests.exceptions.ConnectionError:
-                        print("✗ API Error: Connection failed - Is the server running?")
-                    except Exception as e:
-                        print(f"✗ API Error: {str(e)}")
-                    
-                    self.api_queue.task_done()
-                else:
-                    time.sleep(0.1)
-                    
-            except:
-                time.sleep(0.1)
-        
+                batch = [self.api_queue.get(timeout=0.5)]
+            except Empty:
+                continue
+
+            # None is the shutdown sentinel from stop_api_worker
+            if batch[0] is None:
+                self.api_queue.task_done()
+                break
+
+            # Drain whatever else is already queued so a burst of
+            # detections goes out as a single bulk POST
+            stop = False
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.MAX_BATCH and time.monotonic() < deadline:
+                try:
+                    item = self.api_queue.get_nowait()
+                except Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._post_batch(batch)
+
+            for _ in batch:
+                self.api_queue.task_done()
+
+            if stop:
+                self.api_queue.task_done()  # account for the sentinel
+                break
+
         print("API worker thread stopped")
+
+    def _post_batch(self, batch):
+        """Send queued payloads as one bulk POST, falling back to per-item
+        posts when there is a single item or the server rejects the batch"""
+        if len(batch) > 1:
+            try:
+                response = self.session.post(
+                    self.api_url + "/batch",
+                    json={"plates": batch},
+                    headers={"Content-Type": "application/json"},
+                    timeout=5
+                )
+
+                if response.status_code in [200, 201]:
+                    print(f"✓ Batch of {len(batch)} plates sent successfully to API")
+                    now = time.time()
+                    for data in batch:
+                        self._mark_plate_sent(data['numberPlate'], now)
+                    return
+
+                print(f"✗ Batch endpoint rejected (Status {response.status_code}), sending individually")
+            except requests.exceptions.RequestException as e:
+                print(f"✗ Batch POST failed ({e}), sending individually")
+
+        for data in batch:
+            self._post_single(data)
+
+    def _post_single(self, data):
+        """Send one payload to the API with bounded exponential-backoff retry"""
+        for attempt in range(self.SEND_RETRY_ATTEMPTS):
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    json=data,
+                    headers={"Content-Type": "application/json"},
+                    timeout=5
+                )
+
+                if response.status_code in [200, 201]:
+                    print(f"✓ Data sent successfully to API")
+                    print(f"  Response: {response.text}")
+
+                    # Mark as successfully sent (with timestamp)
+                    self._mark_plate_sent(data['numberPlate'], time.time())
+                    return
+
+                print(f"✗ API Error: Status code {response.status_code}")
+                # Don't add to sent_plates if failed, allow retry
+
+            except requests.exceptions.Timeout:
+                print("✗ API Error: Request timeout")
+            except requests.exceptions.ConnectionError:
+                print("✗ API Error: Connection failed - Is the server running?")
+            except Exception as e:
+                print(f"✗ API Error: {str(e)}")
+
+            if attempt < self.SEND_RETRY_ATTEMPTS - 1:
+                time.sleep(0.2 * (2 ** attempt))
+
+        # All attempts failed - hold this plate off the queue for a while so
+        # a failing backend is not hammered with the same payload
+        self._send_cooldown[data['numberPlate']] = time.time() + self.SEND_FAILURE_COOLDOWN
+        print(f"✗ Giving up on {data['numberPlate']} for {self.SEND_FAILURE_COOLDOWN}s")
     
     def start_api_thread(self):
         """Start the background API thread"""
@@ -154,10 +433,42 @@ class LicensePlateDetector:
             self.api_thread = threading.Thread(target=self._api_worker, daemon=True)
             self.api_thread.start()
     
+    def _plate_worker(self):
+        """Background thread: run the database/payment/gate flow for plates"""
+        while not self.stop_plate_thread:
+            try:
+                plate_text = self.plate_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            if plate_text is None:  # Shutdown sentinel
+                break
+            try:
+                self.handle_plate_detection(plate_text)
+            except Exception as e:
+                print(f"✗ Plate handling error: {e}")
+
+    def start_plate_thread(self):
+        """Start the background plate-handling thread"""
+        if self.plate_thread is None or not self.plate_thread.is_alive():
+            self.stop_plate_thread = False
+            self.plate_thread = threading.Thread(target=self._plate_worker,
+                                                 daemon=True)
+            self.plate_thread.start()
+
+    def stop_plate_worker(self):
+        """Stop the background plate-handling thread"""
+        self.stop_plate_thread = True
+        if self.plate_thread is not None:
+            self.plate_queue.put(None)
+            self.plate_thread.join(timeout=2)
+
     def stop_api_worker(self):
         """Stop the background API thread"""
         self.stop_api_thread = True
         if self.api_thread is not None:
+            # Sentinel wakes the worker immediately instead of letting it
+            # wait out the get() timeout
+            self.api_queue.put(None)
             self.api_thread.join(timeout=2)
     
     def _is_raspberry_pi(self):
@@ -173,28 +484,60 @@ class LicensePlateDetector:
     def capture_frame(self):
         """Capture a frame from the appropriate camera"""
         if self.picam2 is not None:
+            # Camera is configured for BGR888, so the array is already in
+            # OpenCV channel order - no cvtColor copy per frame
             frame = self.picam2.capture_array()
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
         else:
-            ret, frame = self.camera.read()
+            # Flush any stale frames queued by the driver, then decode only
+            # the freshest one - grab() is cheap, decode happens in retrieve()
+            for _ in range(2):
+                self.camera.grab()
+            ret, frame = self.camera.retrieve()
             if not ret:
                 return None
         return frame
     
+    def _bloom_positions(self, plate_text):
+        """The two bit positions a plate occupies in the bloom filter"""
+        mask = self.BLOOM_BITS - 1
+        h = hash(plate_text)
+        return h & mask, (h >> 17) & mask
+
+    def _mark_plate_sent(self, plate_text, timestamp):
+        """Record a processed plate in both the dict and the bloom filter"""
+        self.sent_plates[plate_text] = timestamp
+        for pos in self._bloom_positions(plate_text):
+            self._sent_bloom[pos >> 3] |= 1 << (pos & 7)
+
     def is_plate_already_sent(self, plate_text):
-        """Check if this plate has already been sent to the API"""
-        with self.sent_plates_lock:
-            return plate_text in self.sent_plates
+        """Check if this plate has already been sent to the API
+
+        The bloom filter settles the common negative case with two bit
+        probes; only a "maybe" falls through to the dict."""
+        for pos in self._bloom_positions(plate_text):
+            if not self._sent_bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return plate_text in self.sent_plates
     
     def check_plate_in_database(self, plate_text):
-        """Check if plate exists in database (whitelisted/registered)"""
+        """Check if plate exists in database (whitelisted/registered)
+
+        Answers are remembered for DB_CACHE_TTL seconds - the same car
+        triggers many detections while in view and the whitelist does not
+        change from one second to the next."""
+        hit = self._db_cache.get(plate_text)
+        if hit is not None and time.monotonic() - hit[1] < self.DB_CACHE_TTL:
+            return hit[0]
+
         try:
             url = f"{self.base_api_url}/api/numbers/check/{plate_text}"
-            response = requests.get(url, timeout=3)
-            
+            response = self.session.get(url, timeout=3)
+
             if response.status_code == 200:
                 data = response.json()
-                return data.get('exists', False)
+                exists = data.get('exists', False)
+                self._db_cache[plate_text] = (exists, time.monotonic())
+                return exists
             return False
         except Exception as e:
             print(f"✗ Error checking database: {e}")
@@ -210,7 +553,7 @@ class LicensePlateDetector:
             }
             
             print(f"   → Creating payment order for {plate_text}...")
-            response = requests.post(url, json=payload, timeout=5)
+            response = self.session.post(url, json=payload, timeout=5)
             
             if response.status_code in [200, 201]:
                 data = response.json()
@@ -225,7 +568,8 @@ class LicensePlateDetector:
                 
                 # Store pending payment
                 with self.pending_payments_lock:
-                    self.pending_payments[plate_text] = order_id
+                    self.pending_payments[plate_text] = {
+                        'order_id': order_id, 'attempts': 0}
                 
                 return order_id, qr_code_url, payment_url
             else:
@@ -266,7 +610,7 @@ class LicensePlateDetector:
         """Check if payment is completed"""
         try:
             url = f"{self.base_api_url}/api/numbers/payment/status/{order_id}"
-            response = requests.get(url, timeout=3)
+            response = self.session.get(url, timeout=3)
             
             if response.status_code == 200:
                 data = response.json()
@@ -292,7 +636,7 @@ class LicensePlateDetector:
                 "numberPlate": plate_text,
                 "reason": reason
             }
-            response = requests.post(trigger_url, json=payload, timeout=2)
+            response = self.session.post(trigger_url, json=payload, timeout=2)
             if response.status_code == 200:
                 print(f"✓ Gate trigger sent to backend for Raspberry Pi")
             else:
@@ -301,52 +645,78 @@ class LicensePlateDetector:
             print(f"⚠ Could not send gate trigger: {e}")
             # Don't fail the whole process if trigger fails
     
+    def _check_plate_paid(self, plate_text):
+        """Check whether this plate's payment is already completed
+
+        Cached for DB_CACHE_TTL seconds - a completed payment does not
+        become uncompleted."""
+        hit = self._paid_cache.get(plate_text)
+        if hit is not None and time.monotonic() - hit[1] < self.DB_CACHE_TTL:
+            return hit[0]
+
+        try:
+            url = f"{self.base_api_url}/api/numbers/payment/plate/{plate_text}"
+            response = self.session.get(url, timeout=3)
+            if response.status_code == 200:
+                data = response.json()
+                paid = data.get('paid', False)
+                self._paid_cache[plate_text] = (paid, time.monotonic())
+                return paid
+        except:
+            pass
+        return False
+
     def handle_plate_detection(self, plate_text):
         """Handle detected plate: check database, payment flow, gate control
         Always checks database every time, even for same plate shown multiple times"""
         if len(plate_text) != 10:
             return
-        
+
+        # Debounce: a plate in view fires many detections per second; one
+        # pass through this flow per second is plenty
+        now = time.monotonic()
+        if now - self._last_seen.get(plate_text, 0) < self.PLATE_DEBOUNCE:
+            return
+        self._last_seen[plate_text] = now
+
         current_time = time.time()
         print(f"\n[PROCESSING] Checking plate: {plate_text} (always checks database)")
-        
+
+        # The whitelist check and the paid-status check hit independent
+        # endpoints, so issue both at once and keep the decision order:
+        # serializing them doubled the backend round-trip time per plate
+        db_future = self._lookup_pool.submit(self.check_plate_in_database,
+                                             plate_text)
+        paid_future = self._lookup_pool.submit(self._check_plate_paid,
+                                               plate_text)
+
         # Step 1: ALWAYS check if plate exists in database (no cooldown for database checks)
-        if self.check_plate_in_database(plate_text):
+        if db_future.result():
             print(f"✓ Plate found in database (whitelisted) - Opening gate")
             self.open_gate(plate_text, "Found in database")
             # Update timestamp for tracking (but don't block future checks)
-            with self.sent_plates_lock:
-                self.sent_plates[plate_text] = current_time
+            self._mark_plate_sent(plate_text, current_time)
             return
-        
+
         print(f"✗ Plate NOT found in database - Payment required")
-        
-        # Step 2: Check if payment already completed (checks every time)
-        try:
-            url = f"{self.base_api_url}/api/numbers/payment/plate/{plate_text}"
-            response = requests.get(url, timeout=3)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('paid', False):
-                    print(f"✓ Payment already completed for this plate - Opening gate")
-                    self.open_gate(plate_text, "Payment verified")
-                    # Update timestamp for tracking (but don't block future checks)
-                    with self.sent_plates_lock:
-                        self.sent_plates[plate_text] = current_time
-                    return
-        except:
-            pass
+
+        # Step 2: Check if payment already completed
+        if paid_future.result():
+            print(f"✓ Payment already completed for this plate - Opening gate")
+            self.open_gate(plate_text, "Payment verified")
+            # Update timestamp for tracking (but don't block future checks)
+            self._mark_plate_sent(plate_text, current_time)
+            return
         
         # Step 3: Check cooldown only for payment QR generation (to prevent spam)
-        with self.sent_plates_lock:
-            if plate_text in self.sent_plates:
-                last_processed = self.sent_plates[plate_text]
-                time_since_last = current_time - last_processed
-                if time_since_last < self.DUPLICATE_COOLDOWN:
-                    # Too soon since last payment QR - skip to prevent spam
-                    print(f"[SKIP] Payment QR for {plate_text} shown too recently ({time_since_last:.1f}s ago). Cooldown: {self.DUPLICATE_COOLDOWN}s")
-                    print(f"      (Database was still checked - plate not registered)")
-                    return
+        last_processed = self.sent_plates.get(plate_text)
+        if last_processed is not None:
+            time_since_last = current_time - last_processed
+            if time_since_last < self.DUPLICATE_COOLDOWN:
+                # Too soon since last payment QR - skip to prevent spam
+                print(f"[SKIP] Payment QR for {plate_text} shown too recently ({time_since_last:.1f}s ago). Cooldown: {self.DUPLICATE_COOLDOWN}s")
+                print(f"      (Database was still checked - plate not registered)")
+                return
         
         # Step 4: Create payment and show QR code (only if not in cooldown)
         order_id, qr_code_url, payment_url = self.create_payment_qr(plate_text)
@@ -362,7 +732,10 @@ class LicensePlateDetector:
                 frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
                 frontend_payment_url = f"{frontend_url}/payment?orderId={order_id}&plate={plate_text}"
                 
-                webbrowser.open(frontend_payment_url)
+                # webbrowser.open can block for seconds on some platforms
+                threading.Thread(target=webbrowser.open,
+                                 args=(frontend_payment_url,),
+                                 daemon=True).start()
                 print(f"   → Opened QR code page: {frontend_payment_url}")
                 print(f"   → Scan QR code to proceed to payment")
             except Exception as e:
@@ -378,38 +751,53 @@ class LicensePlateDetector:
             print(f"✗ Failed to create payment order")
     
     def start_payment_polling(self, plate_text, order_id):
-        """Start background thread to poll payment status"""
-        def poll_payment():
-            max_attempts = 60  # Poll for 5 minutes (60 * 5 seconds)
-            attempt = 0
-            
-            while attempt < max_attempts:
-                time.sleep(5)  # Check every 5 seconds
-                attempt += 1
-                
-                if self.check_payment_status(order_id):
+        """Register a pending payment with the shared polling scheduler"""
+        with self.pending_payments_lock:
+            self.pending_payments[plate_text] = {'order_id': order_id, 'attempts': 0}
+        self._ensure_poll_scheduler()
+
+    def _ensure_poll_scheduler(self):
+        """Start the singleton payment-polling thread if not already running
+
+        One daemon thread polls every pending order each cycle over the
+        pooled session, instead of one sleeping thread (and its stack) per
+        plate awaiting payment."""
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            return
+        self._poll_thread = threading.Thread(target=self._poll_payments_loop,
+                                             daemon=True)
+        self._poll_thread.start()
+
+    def _poll_payments_loop(self):
+        max_attempts = 60  # Poll each order for 5 minutes (60 * 5 seconds)
+
+        while True:
+            time.sleep(5)  # Check every 5 seconds
+
+            with self.pending_payments_lock:
+                snapshot = list(self.pending_payments.items())
+
+            for plate_text, pending in snapshot:
+                pending['attempts'] += 1
+
+                if self.check_payment_status(pending['order_id']):
                     print(f"\n✓ Payment completed for {plate_text}!")
                     self.open_gate(plate_text, "Payment successful")
-                    
+
                     # Mark as processed (with timestamp)
-                    with self.sent_plates_lock:
-                        self.sent_plates[plate_text] = time.time()
-                    
-                    # Remove from pending
+                    self._mark_plate_sent(plate_text, time.time())
+
                     with self.pending_payments_lock:
                         self.pending_payments.pop(plate_text, None)
-                    break
-                
-                if attempt % 12 == 0:  # Every minute
-                    print(f"   [Waiting for payment... {attempt * 5}s elapsed]")
-            
-            if attempt >= max_attempts:
-                print(f"\n✗ Payment timeout for {plate_text}")
-                with self.pending_payments_lock:
-                    self.pending_payments.pop(plate_text, None)
-        
-        thread = threading.Thread(target=poll_payment, daemon=True)
-        thread.start()
+                    continue
+
+                if pending['attempts'] >= max_attempts:
+                    print(f"\n✗ Payment timeout for {plate_text}")
+                    with self.pending_payments_lock:
+                        self.pending_payments.pop(plate_text, None)
+                elif pending['attempts'] % 12 == 0:  # Every minute
+                    print(f"   [Waiting for payment on {plate_text}... "
+                          f"{pending['attempts'] * 5}s elapsed]")
     
     def send_to_api(self, plate_text):
         """Send detected plate to backend API (async via queue) - Only 10 character plates"""
@@ -417,7 +805,12 @@ class LicensePlateDetector:
         if len(plate_text) != 10:
             print(f"✗ Rejected: Plate '{plate_text}' has {len(plate_text)} characters. Only 10-character plates are sent.")
             return
-        
+
+        # Skip plates that recently exhausted their send retries
+        retry_after = self._send_cooldown.get(plate_text)
+        if retry_after and time.time() < retry_after:
+            return
+
         try:
             payload = {
                 "numberPlate": plate_text,
@@ -433,101 +826,148 @@ class LicensePlateDetector:
 
     def get_sent_plates_count(self):
         """Get count of unique plates sent to API"""
-        with self.sent_plates_lock:
-            return len(self.sent_plates)
+        return len(self.sent_plates)
     
     def clear_sent_plates_history(self):
         """Clear the history of sent plates (useful for testing or reset)"""
-        with self.sent_plates_lock:
-            count = len(self.sent_plates)
-            self.sent_plates.clear()
-            print(f"Cleared {count} plates from sent history")
+        count = len(self.sent_plates)
+        self.sent_plates.clear()
+        self._sent_bloom = bytearray(self.BLOOM_BITS // 8)
+        print(f"Cleared {count} plates from sent history")
     
+    def _scratch(self, name, shape):
+        """Return a reusable uint8 scratch buffer of the given shape"""
+        buf = self._scratch_bufs.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            self._scratch_bufs[name] = buf
+        return buf
+
     def enhance_image(self, frame):
-        """Fast enhancement optimized for Indian license plates"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
-        # Fast CLAHE for better contrast
-        clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8,8))
-        gray = clahe.apply(gray)
-        
-        # Light denoising for speed
-        gray = cv2.bilateralFilter(gray, 5, 50, 50)
-        
-        return gray
+        """Fast enhancement optimized for Indian license plates
+
+        Accepts BGR or already-grayscale input - callers that have a gray
+        plane handy can pass it directly and skip the conversion."""
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            # Convert to grayscale into a preallocated buffer
+            gray = self._scratch('gray', frame.shape[:2])
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+        # Fast CLAHE for better contrast (cached instance)
+        enhanced = self._scratch('clahe', gray.shape)
+        self.clahe.apply(gray, dst=enhanced)
+
+        # Light denoising for speed - a small separable Gaussian hits OpenCV's
+        # SIMD paths, unlike bilateralFilter, and Scharr downstream only needs
+        # moderate smoothing anyway
+        filtered = self._scratch('filtered', enhanced.shape)
+        cv2.GaussianBlur(enhanced, (3, 3), 0, dst=filtered)
+
+        # Separable unsharp mask to crisp up plate edges - the Gaussian blur
+        # runs as two 1D passes, much cheaper than a dense sharpening kernel
+        cv2.addWeighted(filtered, 1.5, cv2.GaussianBlur(filtered, (0, 0), 1.0),
+                        -0.5, 0, dst=filtered)
+
+        return filtered
     
     def preprocess_for_contours(self, gray):
         """Fast preprocessing for contour detection"""
-        # Single optimized Canny edge detection (faster than multiple)
-        edged = cv2.Canny(gray, 50, 150)
-        
-        # Quick morphological operation to close gaps
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-        edged = cv2.morphologyEx(edged, cv2.MORPH_CLOSE, kernel)
+        # Single Scharr gradient-magnitude pass - cheaper than Canny (no
+        # extra blur, NMS or hysteresis) and yields a superset of its edges
+        gx = cv2.Scharr(gray, cv2.CV_16S, 1, 0)
+        gy = cv2.Scharr(gray, cv2.CV_16S, 0, 1)
+        edged = self._scratch('edged', gray.shape)
+        cv2.addWeighted(cv2.convertScaleAbs(gx), 0.5,
+                        cv2.convertScaleAbs(gy), 0.5, 0, dst=edged)
+        cv2.threshold(edged, 50, 255, cv2.THRESH_BINARY, dst=edged)
+        
+        # Quick morphological operation to close gaps (cached kernel)
+        morphed = self._scratch('morphed', edged.shape)
+        cv2.morphologyEx(edged, cv2.MORPH_CLOSE, self._morph_kernel, dst=morphed)
+        edged = morphed
         
         return edged
     
     def find_license_plate_contours(self, edged, original_shape):
         """Find potential license plate contours optimized for speed"""
-        contours = cv2.findContours(edged.copy(), cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        # Plates are outer contours, so skip the full hierarchy walk; OpenCV 4
+        # no longer mutates the input, so no defensive copy is needed either
+        contours = cv2.findContours(edged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         contours = imutils.grab_contours(contours)
         # Process fewer contours for speed (top 15 instead of 30)
         contours = sorted(contours, key=cv2.contourArea, reverse=True)[:15]
         
+        if not contours:
+            return []
+
+        # Screen candidates with vectorized bounding-box filters first, so the
+        # expensive arcLength/approxPolyDP only runs on the few survivors
+        bboxes = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int32)
+        areas = np.array([cv2.contourArea(c) for c in contours])
+        widths = bboxes[:, 2]
+        heights = bboxes[:, 3]
+        aspect_ratios = widths / np.maximum(heights, 1)
+
+        # Indian license plate criteria:
+        # 1. Should have 4 corners (rectangular)
+        # 2. Aspect ratio between 2.5:1 and 5:1 (Indian plates are wider)
+        # 3. Area should be reasonable (not too small or too large)
+        # 4. Width should be significantly greater than height
+        # Rectangularity (extent) and aspect bonus computed for all candidates
+        # at once, so only the corner count needs per-contour Python work
+        extents = areas / np.maximum(widths * heights, 1)
+        aspect_bonus = np.where(
+            (aspect_ratios >= 3.0) & (aspect_ratios <= 4.2), 1.0, 0.85)
+        confidences = extents * aspect_bonus
+
+        mask = ((aspect_ratios >= 2.5) & (aspect_ratios <= 5.5) &  # Indian plates are typically 3:1 to 4:1
+                (areas > 800) &  # Lower threshold for smaller plates
+                (areas < (original_shape[0] * original_shape[1]) / 3) &
+                (widths > heights * 2) &  # Width must be at least 2x height
+                (extents > 0.55))  # Slightly lower threshold for Indian plates
+
         potential_plates = []
-        
-        for contour in contours:
+
+        # Walk survivors best-first so the top-3 cut needs no re-sort
+        survivors = np.nonzero(mask)[0]
+        for i in survivors[np.argsort(-confidences[survivors])]:
+            contour = contours[i]
             perimeter = cv2.arcLength(contour, True)
             approx = cv2.approxPolyDP(contour, 0.018 * perimeter, True)
-            
-            # Get bounding rectangle
-            x, y, w, h = cv2.boundingRect(contour)
-            aspect_ratio = w / float(h) if h > 0 else 0
-            area = cv2.contourArea(contour)
-            
-            # Indian license plate criteria:
-            # 1. Should have 4 corners (rectangular)
-            # 2. Aspect ratio between 2.5:1 and 5:1 (Indian plates are wider)
-            # 3. Area should be reasonable (not too small or too large)
-            # 4. Width should be significantly greater than height
-            
-            if (len(approx) >= 4 and 
-                2.5 <= aspect_ratio <= 5.5 and  # Indian plates are typically 3:1 to 4:1
-                area > 800 and  # Lower threshold for smaller plates
-                area < (original_shape[0] * original_shape[1]) / 3 and
-                w > h * 2):  # Width must be at least 2x height
-                
-                # Calculate rectangularity (how close to rectangle)
-                rect_area = w * h
-                extent = area / rect_area if rect_area > 0 else 0
-                
-                if extent > 0.55:  # Slightly lower threshold for Indian plates
-                    # Higher confidence for ideal Indian plate aspect ratio (3:1 to 4:1)
-                    aspect_bonus = 1.0 if 3.0 <= aspect_ratio <= 4.2 else 0.85
-                    potential_plates.append({
-                        'contour': approx,
-                        'bbox': (x, y, w, h),
-                        'area': area,
-                        'aspect_ratio': aspect_ratio,
-                        'confidence': extent * aspect_bonus
-                    })
-        
-        # Sort by confidence
-        potential_plates.sort(key=lambda x: x['confidence'], reverse=True)
-        
-        return potential_plates[:3]  # Return top 3 candidates for faster processing
+
+            if len(approx) < 4:
+                continue
+
+            x, y, w, h = bboxes[i]
+            potential_plates.append({
+                'contour': approx,
+                'bbox': (int(x), int(y), int(w), int(h)),
+                'area': areas[i],
+                'aspect_ratio': aspect_ratios[i],
+                'confidence': confidences[i]
+            })
+            if len(potential_plates) == 3:  # Top 3 candidates for faster processing
+                break
+
+        return potential_plates
     
+    def _is_state_code(self, code):
+        """Table lookup for a 2-letter state code (digits fail the guard)"""
+        return (len(code) == 2 and
+                'A' <= code[0] <= 'Z' and 'A' <= code[1] <= 'Z' and
+                self._state_code_tbl[(ord(code[0]) - 65) * 26 + (ord(code[1]) - 65)])
+
     def clean_text(self, text):
         """Clean and validate detected text for Indian license plates"""
-        if not text:
+        # Short-circuit: nothing shorter than 4 chars can become a plate
+        if not text or len(text) < 4:
             return ""
-        
-        # Remove special characters but keep alphanumeric and spaces
-        text = re.sub(r'[^A-Z0-9\s]', '', text.upper())
-        
-        # Remove spaces and join (Indian plates typically have no spaces)
-        text = re.sub(r'\s+', '', text)
+
+        # Uppercase and keep only plate characters (letters/digits) in one
+        # table-driven pass; Indian plates have no spaces anyway
+        text = text.upper().translate(_PLATE_TRANS)
         
         # Common OCR mistakes: replace similar-looking characters
         replacements = {
@@ -544,7 +984,7 @@ class LicensePlateDetector:
             for wrong, correct in replacements.items():
                 if wrong in state_code:
                     test_code = state_code.replace(wrong, correct)
-                    if test_code in self.indian_state_codes:
+                    if self._is_state_code(test_code):
                         text = test_code + text[2:]
                         break
         
@@ -559,28 +999,26 @@ class LicensePlateDetector:
         # Check if starts with valid state code
         if len(text) >= 2:
             state_code = text[:2]
-            if state_code not in self.indian_state_codes:
+            if not self._is_state_code(state_code):
                 # Try to find state code if text has extra characters at start
                 for i in range(min(3, len(text) - 1)):
                     potential_state = text[i:i+2]
-                    if potential_state in self.indian_state_codes:
+                    if self._is_state_code(potential_state):
                         text = text[i:]  # Remove prefix
                         break
                 else:
                     # If still no valid state code found, return empty
-                    if text[:2] not in self.indian_state_codes:
+                    if not self._is_state_code(text[:2]):
                         return ""
         
-        # Validate pattern: XX##XX#### or XX##XXX####
-        # Pattern: 2 letters + 2 digits + 2-3 letters + 4 digits
-        pattern_old = r'^[A-Z]{2}\d{2}[A-Z]{2}\d{4}$'  # Old format: MH12AB1234
-        pattern_new = r'^[A-Z]{2}\d{2}[A-Z]{3}\d{4}$'  # New format: MH12ABC1234
-        
+        # Validate pattern: XX##XX#### (old, e.g. MH12AB1234) or
+        # XX##XXX#### (new, e.g. MH12ABC1234) via the positional checker
+
         # Try to match and fix common OCR errors
         cleaned = text.replace(' ', '').replace('-', '').replace('.', '')
-        
+
         # Check if matches pattern (allowing for some OCR errors)
-        if re.match(pattern_old, cleaned) or re.match(pattern_new, cleaned):
+        if _matches_plate_format(cleaned):
             return cleaned
         
         # Try to fix common OCR mistakes and validate again
@@ -605,17 +1043,72 @@ class LicensePlateDetector:
                         cleaned = cleaned[:3] + ('0' if cleaned[3] == 'O' else '1' if cleaned[3] == 'I' else cleaned[3]) + cleaned[4:]
             
             # Final validation
-            if re.match(pattern_old, cleaned) or re.match(pattern_new, cleaned):
+            if _matches_plate_format(cleaned):
                 return cleaned
         
         # If text is close to valid format (8-11 chars, has letters and digits)
         if 8 <= len(cleaned) <= 11 and any(c.isdigit() for c in cleaned) and any(c.isalpha() for c in cleaned):
             # Check if first 2 chars are valid state code
-            if len(cleaned) >= 2 and cleaned[:2] in self.indian_state_codes:
+            if len(cleaned) >= 2 and self._is_state_code(cleaned[:2]):
                 return cleaned
         
         return ""
     
+    def _read_plate_batch(self, images):
+        """Run EasyOCR over a list of same-sized images, batching them through
+        one recognizer pass when the installed EasyOCR supports it"""
+        if len(images) > 1 and hasattr(self.reader, 'readtext_batched'):
+            try:
+                batched = self.reader.readtext_batched(
+                    images,
+                    detail=1,
+                    paragraph=False,
+                    allowlist=self.OCR_ALLOWLIST,
+                    width_ths=0.7,
+                    height_ths=0.7,
+                    batch_size=len(images)  # one recognizer pass for the lot
+                )
+                return [r for per_image in batched for r in per_image]
+            except Exception:
+                pass
+
+        # Without readtext_batched, tile same-width variants into one tall
+        # montage so the detector+recognizer still run once per batch; the
+        # callers only consume text/confidence, so the stacked y-offsets in
+        # the returned boxes don't need splitting back out
+        if len(images) > 1 and all(i.shape[1] == images[0].shape[1] for i in images):
+            separator = np.full((16, images[0].shape[1]), 255, dtype=images[0].dtype)
+            stack = []
+            for image in images:
+                stack.append(image)
+                stack.append(separator)
+            try:
+                return self.reader.readtext(
+                    np.vstack(stack[:-1]),
+                    detail=1,
+                    paragraph=False,
+                    allowlist=self.OCR_ALLOWLIST,
+                    width_ths=0.7,
+                    height_ths=0.7
+                )
+            except Exception:
+                pass
+
+        results = []
+        for image in images:
+            try:
+                results.extend(self.reader.readtext(
+                    image,
+                    detail=1,
+                    paragraph=False,
+                    allowlist=self.OCR_ALLOWLIST,
+                    width_ths=0.7,
+                    height_ths=0.7
+                ))
+            except Exception:
+                continue
+        return results
+
     def extract_text_from_roi(self, frame, bbox):
         """Extract and process text from region of interest - optimized for Indian plates"""
         x, y, w, h = bbox
@@ -632,181 +1125,408 @@ class LicensePlateDetector:
         if roi.size == 0:
             return "", 0
         
-        # Resize ROI for better OCR (upscale more aggressively for Indian plates)
-        min_width = 250  # Indian plates need more width for accurate reading
-        if w < min_width:
-            scale = min_width / w
+        # Normalize every ROI to a fixed 200px-wide canvas: a stable input
+        # shape lets the recognizer reuse its internal tensor allocations,
+        # and bilinear reads 4 neighbors per pixel where cubic reads 16
+        TARGET_WIDTH = 200
+        if w != TARGET_WIDTH:
+            scale = TARGET_WIDTH / w
             # Limit scale to avoid too much blur
             scale = min(scale, 3.0)
-            roi = cv2.resize(roi, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+            # Bilinear for upscales, area-averaging when the crop shrinks
+            interp = cv2.INTER_LINEAR if scale >= 1.0 else cv2.INTER_AREA
+            roi = cv2.resize(roi, (int(w * scale), max(1, int(h * scale))),
+                             interpolation=interp)
         
         # Convert to grayscale if needed
         if len(roi.shape) == 3:
             roi_gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
         else:
             roi_gray = roi
-        
-        # Fast preprocessing for Indian plates
-        clahe = cv2.createCLAHE(clipLimit=2.5, tileGridSize=(8,8))
-        roi_gray = clahe.apply(roi_gray)
-        
-        # Apply only the most effective thresholding methods (reduced from 6 to 3)
+
+        # Reuse the OCR result for near-identical crops - the same plate stays
+        # in view for many frames and each readtext call is the dominant cost
+        dhash = _dhash64(roi_gray)
+        cached = self._ocr_cache_lookup(dhash)
+        if cached is not None:
+            return cached
+
+        # Fast preprocessing for Indian plates (shared CLAHE instance; fine
+        # because ROI processing stays on the single detection thread)
+        roi_gray = self.clahe.apply(roi_gray)
+        
+        # Pick the threshold polarity from the ROI brightness instead of
+        # always running both: dark plates (white-on-black text) need the
+        # inverted variant, everything else the normal one
+        dark_plate = roi_gray.mean() < 90
+        polarity = cv2.THRESH_BINARY_INV if dark_plate else cv2.THRESH_BINARY
+
+        # Flat lighting (low contrast spread) means a single global Otsu
+        # split is as good as the adaptive pass - skip straight to it and
+        # save an OCR call; under uneven lighting adaptive goes first with
+        # Otsu only as the weak-result fallback
+        flat_lighting = roi_gray.std() < 25
+
         results_list = []
-        
-        # Method 1: Otsu's thresholding (most reliable)
-        _, thresh1 = cv2.threshold(roi_gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        
-        # Method 2: Adaptive thresholding (good for varying lighting)
-        thresh2 = cv2.adaptiveThreshold(roi_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                        cv2.THRESH_BINARY, 11, 2)
-        
-        # Method 3: Inverted binary (for white text on dark background)
-        _, thresh3 = cv2.threshold(roi_gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        
-        # Try OCR on 3 most effective methods with optimized settings
-        for thresh in [thresh1, thresh2, thresh3]:
-            try:
-                results = self.reader.readtext(
-                    thresh, 
-                    detail=1, 
-                    paragraph=False,
-                    allowlist='ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789',
-                    width_ths=0.7,
-                    height_ths=0.7,
-                    batch_size=1  # Process one at a time for faster response
-                )
-                results_list.extend(results)
-                
-                # Early exit if we find a valid Indian plate with good confidence
-                for result in results:
-                    text = result[1]
-                    confidence = result[2]
-                    cleaned = self.clean_text(text)
-                    if cleaned and re.match(r'^[A-Z]{2}\d{2}[A-Z]{2,3}\d{4}$', cleaned) and confidence > 0.6:
-                        # Found a good match, return immediately
-                        return cleaned, min(confidence * 1.2, 1.0)
-            except:
-                continue
-        
-        # Find best result with Indian plate validation
-        best_text = ""
-        best_confidence = 0
-        
-        for detection in results_list:
-            text = detection[1]
-            confidence = detection[2]
-            
+        if not flat_lighting:
+            thresh_adaptive = cv2.adaptiveThreshold(roi_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                            polarity, 11, 2)
+            results_list = self._read_plate_batch([thresh_adaptive])
+
+        if not results_list or max(r[2] for r in results_list) < 0.5:
+            _, thresh_otsu = cv2.threshold(roi_gray, 0, 255,
+                                           polarity + cv2.THRESH_OTSU)
+            results_list.extend(self._read_plate_batch([thresh_otsu]))
+
+        # Early exit if we find a valid Indian plate with good confidence
+        for result in results_list:
+            text = result[1]
+            confidence = result[2]
             cleaned = self.clean_text(text)
+            if cleaned and _PLATE_RE.match(cleaned) and confidence > 0.6:
+                # Found a good match, return immediately
+                return self._ocr_cache_store(
+                    dhash, (cleaned, min(confidence * 1.2, 1.0)))
+        
+        # Find best result with Indian plate validation - clean each
+        # candidate once, then let NumPy pick the winner
+        cleaned_texts = []
+        confidences = []
+        for detection in results_list:
+            cleaned = self.clean_text(detection[1])
             if cleaned:
+                confidence = detection[2]
                 # Boost confidence if it matches Indian plate pattern perfectly
-                if re.match(r'^[A-Z]{2}\d{2}[A-Z]{2,3}\d{4}$', cleaned):
+                if _PLATE_RE.match(cleaned):
                     confidence *= 1.2  # Boost confidence for valid format
-                
-                if confidence > best_confidence:
-                    best_text = cleaned
-                    best_confidence = min(confidence, 1.0)  # Cap at 1.0
-        
-        return best_text, best_confidence
+                cleaned_texts.append(cleaned)
+                confidences.append(confidence)
+
+        if not cleaned_texts:
+            return self._ocr_cache_store(dhash, ("", 0))
+
+        confidences = np.fromiter(confidences, dtype=np.float32,
+                                  count=len(confidences))
+        best = int(confidences.argmax())
+        return self._ocr_cache_store(
+            dhash, (cleaned_texts[best], min(float(confidences[best]), 1.0)))
+
+    def _ocr_cache_lookup(self, dhash):
+        """Return the cached OCR result for this ROI hash (or a near-identical
+        one within Hamming distance 4), refreshing its LRU position"""
+        hit = self._ocr_cache.get(dhash)
+        if hit is None:
+            # Cache is small, so a linear scan for near-duplicates is cheap
+            for key in self._ocr_cache:
+                if bin(key ^ dhash).count('1') <= 4:
+                    hit = self._ocr_cache[key]
+                    dhash = key
+                    break
+        if hit is not None:
+            self._ocr_cache.move_to_end(dhash)
+        return hit
+
+    def _ocr_cache_store(self, dhash, result):
+        """Store an OCR result, evicting the least recently used entry"""
+        self._ocr_cache[dhash] = result
+        if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return result
     
+    def _detect_plate(self, frame, send_to_api=True):
+        """Run the full detection pipeline on one frame.
+        Returns a result dict describing the best detection (or None) that
+        _draw_detection can render onto any frame"""
+        # Grayscale once at full resolution - the thumbnail, the contour
+        # pipeline and the OCR crops below all work off this single plane
+        # instead of each converting (or carrying 3 channels) on their own
+        gray_full = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # Motion gate: if the scene has barely changed since the last frame we
+        # processed, skip the contour/OCR pipeline and reuse the old result
+        thumb = cv2.resize(gray_full, (160, 120), interpolation=cv2.INTER_AREA)
+        if (self._last_thumb is not None and
+                cv2.absdiff(thumb, self._last_thumb).mean() < self.MOTION_THRESHOLD):
+            return self._last_detection
+        self._last_thumb = thumb
+
+        # Run the contour pipeline on a downscaled copy - plates are still
+        # plenty large at 0.6x and pixel traffic through enhancement/edge
+        # detection drops ~2.5x. OCR below still crops the full frame.
+        DETECT_SCALE = 0.6
+        small = cv2.resize(gray_full, None, fx=DETECT_SCALE, fy=DETECT_SCALE,
+                           interpolation=cv2.INTER_AREA)
+
+        # Enhance image
+        gray = self.enhance_image(small)
+
+        # Preprocess for contour detection
+        edged = self.preprocess_for_contours(gray)
+
+        # Find potential license plates
+        potential_plates = self.find_license_plate_contours(edged, small.shape)
+
+        # Map candidate geometry back to full-resolution coordinates
+        inv_scale = 1.0 / DETECT_SCALE
+        for plate in potential_plates:
+            x, y, w, h = plate['bbox']
+            plate['bbox'] = (int(x * inv_scale), int(y * inv_scale),
+                             int(w * inv_scale), int(h * inv_scale))
+            plate['contour'] = (plate['contour'] * inv_scale).astype(np.int32)
+
+        best_plate = None
+        best_confidence = 0
+
+        for plate in potential_plates:
+            # Extract text from this region
+            text, confidence = self.extract_text_from_roi(gray_full, plate['bbox'])
+
+            if not text:
+                continue
+
+            # A high-confidence Indian-format match wins outright - check it
+            # before the running-best comparison so the common "first
+            # candidate is good" case builds one dict and stops scanning
+            if confidence > 0.7 and _PLATE_RE.match(text):
+                best_plate = {
+                    'text': text,
+                    'confidence': confidence,
+                    'bbox': plate['bbox'],
+                    'contour': plate['contour']
+                }
+                best_confidence = confidence
+                break
+
+            if confidence > best_confidence:
+                best_plate = {
+                    'text': text,
+                    'confidence': confidence,
+                    'bbox': plate['bbox'],
+                    'contour': plate['contour']
+                }
+                best_confidence = confidence
+
+        if not (best_plate and best_confidence > 0.25):  # Lower threshold for Indian plates (more lenient)
+            self._last_detection = None
+            return None
+
+        plate_text = best_plate['text']
+        plate_length = len(plate_text)
+        is_valid_length = (plate_length == 10)  # Only 10 characters are valid for sending
+
+        # Check if already sent (only for valid 10-character plates)
+        already_sent = False
+        if is_valid_length:
+            already_sent = self.is_plate_already_sent(plate_text)
+
+        # Determine color based on status
+        if not is_valid_length:
+            color = _ORANGE  # invalid length (not 10 chars)
+        elif already_sent:
+            color = _GRAY  # already sent
+        else:
+            color = _GREEN  # valid and ready to send
+
+        # Display text and confidence with status
+        if not is_valid_length:
+            status = f" [INVALID - {plate_length} chars]"
+        elif already_sent:
+            status = " [SENT]"
+        else:
+            status = " [READY]"
+
+        # Print to terminal - the multi-line breakdown only in verbose mode;
+        # over a line-buffered SSH tty those extra flushes add up at frame
+        # rate, so the default is a single summary line per detection
+        if self.verbose:
+            _plate_log.info(f"\n[DETECTED] License Plate: {plate_text}")
+            _plate_log.info(f"           Length: {plate_length} characters")
+            _plate_log.info(f"           Confidence: {best_confidence:.2%}")
+            if not is_valid_length:
+                _plate_log.info(f"           Status: Invalid length - must be 10 characters (not sending)")
+            elif already_sent:
+                _plate_log.info(f"           Status: Already sent to API")
+            else:
+                _plate_log.info(f"           Status: Valid 10-character plate - Ready to send")
+        else:
+            _plate_log.info(f"[DETECTED] {plate_text} ({best_confidence:.2%}){status}")
+
+        # Handle plate detection: check database, payment, gate control
+        # Only if:
+        # 1. send_to_api is enabled
+        # 2. Not already sent
+        # 3. Plate is exactly 10 characters
+        if send_to_api and not already_sent and is_valid_length:
+            # Hand off to the plate worker so the payment flow's HTTP calls
+            # (and their timeouts) never stall detection
+            self.start_plate_thread()
+            self.plate_queue.put(plate_text)
+
+        result = {
+            'text': plate_text,
+            'confidence': best_confidence,
+            'bbox': best_plate['bbox'],
+            'contour': best_plate['contour'],
+            'color': color,
+            'label': f"{plate_text} ({best_confidence:.2%}){status}",
+            'time': time.time()
+        }
+        self._last_detection = result
+        return result
+
+    def _draw_detection(self, frame, result):
+        """Draw a detection result onto a frame"""
+        x, y, w, h = result['bbox']
+        # The rectangle alone marks the plate; rasterizing the contour on
+        # top of it in the same color was redundant drawing work
+        cv2.rectangle(frame, (x, y), (x+w, y+h), result['color'], 2)
+        cv2.putText(frame, result['label'], (x, y-10),
+                   _FONT, 0.9, result['color'], 2)
+
+    def _detect_worker(self, send_api):
+        """Background thread: run detection on the freshest captured frame"""
+        print("Detection worker thread started")
+
+        while not self.stop_detect_thread:
+            try:
+                frame = self.detect_queue.get(timeout=0.5)
+            except Empty:
+                continue
+
+            try:
+                result = self._detect_plate(frame, send_to_api=send_api)
+            except Exception as e:
+                print(f"✗ Detection error: {e}")
+                continue
+
+            if result is not None:
+                with self.latest_result_lock:
+                    self.latest_result = result
+
+        print("Detection worker thread stopped")
+
+    def start_detect_thread(self, send_api=True):
+        """Start the background detection thread"""
+        if self.detect_thread is None or not self.detect_thread.is_alive():
+            self.stop_detect_thread = False
+            self.detect_thread = threading.Thread(target=self._detect_worker,
+                                                  args=(send_api,), daemon=True)
+            self.detect_thread.start()
+
+    def stop_detect_worker(self):
+        """Stop the background detection thread"""
+        self.stop_detect_thread = True
+        if self.detect_thread is not None:
+            self.detect_thread.join(timeout=2)
+
+    def _capture_worker(self):
+        """Background thread: keep the freshest camera frame on offer"""
+        while not self.stop_capture_thread:
+            frame = self.capture_frame()
+            if frame is None:
+                time.sleep(0.1)
+                continue
+            try:
+                self.capture_queue.put_nowait(frame)
+            except Full:
+                try:
+                    self.capture_queue.get_nowait()
+                except Empty:
+                    pass
+                try:
+                    self.capture_queue.put_nowait(frame)
+                except Full:
+                    pass
+
+    def start_capture_thread(self):
+        """Start the background capture thread"""
+        if self.capture_thread is None or not self.capture_thread.is_alive():
+            self.stop_capture_thread = False
+            self.capture_thread = threading.Thread(target=self._capture_worker,
+                                                   daemon=True)
+            self.capture_thread.start()
+
+    def stop_capture_worker(self):
+        """Stop the background capture thread"""
+        self.stop_capture_thread = True
+        if self.capture_thread is not None:
+            self.capture_thread.join(timeout=2)
+
+    def _display_worker(self):
+        """Background thread: render frames and poll the keyboard"""
+        while not self.stop_display_thread:
+            try:
+                frame = self.display_queue.get(timeout=0.2)
+            except Empty:
+                continue
+            cv2.imshow("Enhanced License Plate Detection", frame)
+            key = cv2.waitKey(1) & 0xFF
+            if key != 255:
+                self.last_key = key
+
+    def start_display_thread(self):
+        """Start the background display thread"""
+        if self.display_thread is None or not self.display_thread.is_alive():
+            self.stop_display_thread = False
+            self.display_thread = threading.Thread(target=self._display_worker,
+                                                   daemon=True)
+            self.display_thread.start()
+
+    def stop_display_worker(self):
+        """Stop the background display thread"""
+        self.stop_display_thread = True
+        if self.display_thread is not None:
+            self.display_thread.join(timeout=2)
+
     def detect_and_display(self, frame, send_to_api=True, process_detection=True):
-        """Detect license plate with enhanced accuracy"""
+        """Detect license plate with enhanced accuracy (synchronous path)"""
         detected_plate = None
-        
+
         if process_detection:
-            # Enhance image
-            gray = self.enhance_image(frame)
-            
-            # Preprocess for contour detection
-            edged = self.preprocess_for_contours(gray)
-            
-            # Find potential license plates
-            potential_plates = self.find_license_plate_contours(edged, frame.shape)
-            
-            best_plate = None
-            best_confidence = 0
-            
-            for plate in potential_plates:
-                # Extract text from this region
-                text, confidence = self.extract_text_from_roi(frame, plate['bbox'])
-                
-                if text and confidence > best_confidence:
-                    best_plate = {
-                        'text': text,
-                        'confidence': confidence,
-                        'bbox': plate['bbox'],
-                        'contour': plate['contour']
-                    }
-                    best_confidence = confidence
-                    
-                    # Early exit if we found a high-confidence Indian plate match
-                    if confidence > 0.7 and re.match(r'^[A-Z]{2}\d{2}[A-Z]{2,3}\d{4}$', text):
-                        break
-            
-            if best_plate and best_confidence > 0.25:  # Lower threshold for Indian plates (more lenient)
-                x, y, w, h = best_plate['bbox']
-                
-                plate_text = best_plate['text']
-                plate_length = len(plate_text)
-                is_valid_length = (plate_length == 10)  # Only 10 characters are valid for sending
-                
-                # Check if already sent (only for valid 10-character plates)
-                already_sent = False
-                if is_valid_length:
-                    already_sent = self.is_plate_already_sent(plate_text)
-                
-                # Determine color based on status
-                if not is_valid_length:
-                    color = (0, 165, 255)  # Orange - invalid length (not 10 chars)
-                elif already_sent:
-                    color = (128, 128, 128)  # Gray - already sent
-                else:
-                    color = (0, 255, 0)  # Green - valid and ready to send
-                
-                cv2.drawContours(frame, [best_plate['contour']], -1, color, 3)
-                cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
-                
-                # Display text and confidence with status
-                if not is_valid_length:
-                    status = f" [INVALID - {plate_length} chars]"
-                elif already_sent:
-                    status = " [SENT]"
-                else:
-                    status = " [READY]"
-                
-                label = f"{plate_text} ({best_confidence:.2%}){status}"
-                cv2.putText(frame, label, (x, y-10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
-                
-                # Print to terminal
-                print(f"\n[DETECTED] License Plate: {plate_text}")
-                print(f"           Length: {plate_length} characters")
-                print(f"           Confidence: {best_confidence:.2%}")
-                if not is_valid_length:
-                    print(f"           Status: Invalid length - must be 10 characters (not sending)")
-                elif already_sent:
-                    print(f"           Status: Already sent to API")
-                else:
-                    print(f"           Status: Valid 10-character plate - Ready to send")
-                
-                # Handle plate detection: check database, payment, gate control
-                # Only if:
-                # 1. send_to_api is enabled
-                # 2. Not already sent
-                # 3. Plate is exactly 10 characters
-                if send_to_api and not already_sent and is_valid_length:
-                    # Use the new payment flow instead of just sending to API
-                    self.handle_plate_detection(plate_text)
-                
-                detected_plate = plate_text
-        
+            result = self._detect_plate(frame, send_to_api=send_to_api)
+            if result is not None:
+                self._draw_detection(frame, result)
+                detected_plate = result['text']
+
         return detected_plate
     
-    def run_detection(self, save_detections=False, output_dir="detections", send_api=True):
-        """Run continuous license plate detection optimized for Indian plates"""
+    # Size of the corner strip the status overlay occupies; blending is
+    # confined to this region rather than touching the whole frame
+    OVERLAY_H = 100
+    OVERLAY_W = 320
+
+    def _status_overlay(self, fps, sent_count, last_detection):
+        """Return the status-text overlay strip, re-rasterizing it only when
+        one of the displayed values changes"""
+        key = (round(fps, 1), sent_count, last_detection)
+        if self._overlay is None or key != self._overlay_key:
+            overlay = np.zeros((self.OVERLAY_H, self.OVERLAY_W, 3), np.uint8)
+            cv2.putText(overlay, f"FPS: {key[0]}", (10, 30),
+                       _FONT, 0.7, _CYAN, 2)
+            cv2.putText(overlay, f"Sent: {sent_count}", (10, 60),
+                       _FONT, 0.7, _CYAN, 2)
+            if last_detection:
+                cv2.putText(overlay, f"Last: {last_detection}", (10, 90),
+                           _FONT, 0.7, _YELLOW, 2)
+            self._overlay = overlay
+            self._overlay_key = key
+        return self._overlay
+
+    def run_detection(self, save_detections=False, output_dir="detections",
+                      send_api=True, headless=False):
+        """Run continuous license plate detection optimized for Indian plates
+
+        With headless=True no window is opened and all drawing/compositing
+        is skipped; SIGUSR1 saves the current frame, SIGUSR2 resets the
+        sent history and Ctrl+C quits."""
         print("Starting Indian License Plate Detection System...")
         print("Optimized for Indian number plate formats (XX##XX#### or XX##XXX####)")
-        print("REAL-TIME MODE: Processing every frame for immediate detection")
-        print("Press 'q' to quit, 's' to save current frame, 'r' to reset sent history\n")
+        print("REAL-TIME MODE: Detection runs in a background worker on the freshest frame")
+        if headless:
+            print("HEADLESS MODE: no display - Ctrl+C to quit, "
+                  "SIGUSR1 saves a frame, SIGUSR2 resets sent history\n")
+        else:
+            print("Press 'q' to quit, 's' to save current frame, 'r' to reset sent history\n")
         print("Tips for better detection:")
         print("  - Ensure good lighting (Indian plates often have reflective surfaces)")
         print("  - Keep plate 2-6 feet from camera")
@@ -816,7 +1536,25 @@ class LicensePlateDetector:
         
         if send_api:
             self.start_api_thread()
-        
+
+        self.start_detect_thread(send_api)
+        if not headless:
+            self.start_display_thread()
+        self.start_capture_thread()
+
+        # Headless runs replace the keyboard with signals; flags set here
+        # are consumed at the top of the loop on the main thread
+        self._save_requested = False
+        self._reset_requested = False
+        if headless:
+            try:
+                signal.signal(signal.SIGUSR1,
+                              lambda *_: setattr(self, '_save_requested', True))
+                signal.signal(signal.SIGUSR2,
+                              lambda *_: setattr(self, '_reset_requested', True))
+            except (ValueError, AttributeError):
+                pass  # Not on the main thread, or platform without SIGUSR
+
         if save_detections:
             import os
             os.makedirs(output_dir, exist_ok=True)
@@ -825,73 +1563,95 @@ class LicensePlateDetector:
         frame_count = 0
         last_detection = None
         
-        # FPS calculation
-        fps_start_time = time.time()
+        # FPS calculation on the monotonic nanosecond clock - immune to NTP
+        # steps and integer-only until the overlay needs the value
+        fps_start_ns = time.perf_counter_ns()
         fps_counter = 0
         fps = 0
         
-        # Processing control - process every frame for real-time detection
-        PROCESS_EVERY_N_FRAMES = 1  # Process every frame for immediate detection
-        
         try:
             while True:
-                frame = self.capture_frame()
-                
-                if frame is None:
+                # Freshest frame from the capture worker (latest wins)
+                try:
+                    frame = self.capture_queue.get(timeout=2)
+                except Empty:
                     print("Error: Could not capture frame")
                     break
-                
+
                 # Calculate FPS
                 fps_counter += 1
                 if fps_counter >= 30:
-                    fps = fps_counter / (time.time() - fps_start_time)
-                    fps_start_time = time.time()
+                    now_ns = time.perf_counter_ns()
+                    fps = fps_counter * 1_000_000_000 / max(1, now_ns - fps_start_ns)
+                    fps_start_ns = now_ns
                     fps_counter = 0
-                
+
                 frame_count += 1
-                
-                # Process every frame for real-time detection
-                should_process = (frame_count % PROCESS_EVERY_N_FRAMES == 0)
-                
-                # Detect license plate in real-time
-                plate_text = self.detect_and_display(frame, 
-                                                     send_to_api=send_api,
-                                                     process_detection=should_process)
-                
-                if plate_text:
-                    last_detection = plate_text
-                
-                # Display FPS and sent count
-                cv2.putText(frame, f"FPS: {fps:.1f}", (10, 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                
-                sent_count = self.get_sent_plates_count()
-                cv2.putText(frame, f"Sent: {sent_count}", (10, 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                
-                if last_detection:
-                    cv2.putText(frame, f"Last: {last_detection}", (10, 90),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-                
-                # Show frame
-                cv2.imshow("Enhanced License Plate Detection", frame)
-                
-                key = cv2.waitKey(1) & 0xFF
-                
+
+                # Hand the freshest frame to the detection worker; drop it if
+                # the worker is still busy so capture never stalls on OCR
+                try:
+                    self.detect_queue.put_nowait(frame.copy())
+                except Full:
+                    pass
+
+                # Draw the worker's most recent detection (if still fresh)
+                with self.latest_result_lock:
+                    result = self.latest_result
+
+                if result is not None:
+                    last_detection = result['text']
+                    if not headless and time.time() - result['time'] < 2.0:
+                        self._draw_detection(frame, result)
+
+                if not headless:
+                    # Blend the cached status overlay - glyphs are
+                    # re-rasterized only when the displayed values change
+                    sent_count = len(self.sent_plates)  # O(1), no method dispatch
+                    overlay = self._status_overlay(fps, sent_count,
+                                                   last_detection)
+                    corner = frame[:self.OVERLAY_H, :self.OVERLAY_W]
+                    cv2.add(corner, overlay, dst=corner)
+
+                    # Hand the frame to the display worker (latest wins) so
+                    # GUI compositing overlaps capture instead of blocking it
+                    try:
+                        self.display_queue.put_nowait(frame)
+                    except Full:
+                        try:
+                            self.display_queue.get_nowait()
+                        except Empty:
+                            pass
+                        try:
+                            self.display_queue.put_nowait(frame)
+                        except Full:
+                            pass
+
+                # Consume whatever key the display thread last saw (headless
+                # runs never see key presses - signals set the flags instead)
+                key = self.last_key
+                self.last_key = 255
+
                 if key == ord('q'):
                     break
-                elif key == ord('s') and save_detections:
+                elif (key == ord('s') or self._save_requested) and save_detections:
+                    self._save_requested = False
                     detection_count += 1
                     filename = f"{output_dir}/detection_{detection_count}.jpg"
                     cv2.imwrite(filename, frame)
                     print(f"Saved: {filename}")
-                elif key == ord('r'):
+                elif key == ord('r') or self._reset_requested:
+                    self._reset_requested = False
                     self.clear_sent_plates_history()
         
         except KeyboardInterrupt:
             print("\nStopping detection...")
         
         finally:
+            self.stop_capture_worker()
+            self.stop_display_worker()
+            self.stop_detect_worker()
+
             if send_api:
                 print("Waiting for pending API requests...")
                 self.api_queue.join()
@@ -921,8 +1681,11 @@ class LicensePlateDetector:
         """Clean up resources"""
         print("\nCleaning up...")
         
+        self.stop_plate_worker()
         self.stop_api_worker()
-        
+        self._lookup_pool.shutdown(wait=False)
+        self.session.close()
+
         if self.picam2 is not None:
             self.picam2.stop()
         if self.camera is not None:
@@ -40,11 +40,21 @@ except ImportError:
 # Or edit the line below with your laptop's IP address
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://10.122.220.83:4000')  # Change to your laptop's IP address
 ENDPOINT = os.getenv('ENDPOINT', '/api/numbers/trigger-gate')  # Endpoint to check for gate trigger
-CHECK_INTERVAL = 2  # Check every 2 seconds
+CHECK_INTERVAL = 2  # Fallback poll interval (seconds) for old backends
+LONG_POLL_WAIT = 30  # Seconds the backend may hold a poll open (long-polling)
 SERVO_PIN = 17  # GPIO pin for servo (change if needed)
 LED_PIN = 27  # GPIO pin for LED (change if needed - common pins: 18, 27, 22)
 SERVO_ROTATION_TIME = 10  # Time to continuously rotate servo (seconds)
 
+# One keep-alive session for the poll loop - reusing the socket avoids a
+# fresh TCP handshake every 2 seconds; a single pooled connection is all
+# the Pi needs
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                         max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 
 class LEDController:
     """Controls LED using gpiozero or RPi.GPIO"""
@@ -130,7 +140,15 @@ class ServoController:
     def __init__(self, pin=18):
         self.pin = pin
         self.is_rotating = False
-        
+
+        # Precomputed angle mappings for every integer degree - set_position
+        # sits on the real-time gate path, so the per-call float arithmetic
+        # becomes a tuple index
+        # gpiozero: 0° -> -1, 90° -> 0, 180° -> 1
+        self._value_lut = tuple((a - 90) / 90.0 for a in range(181))
+        # RPi.GPIO duty cycle: 0° = 2.5%, 90° = 7.5%, 180° = 12.5%
+        self._duty_lut = tuple(2.5 + a / 18.0 for a in range(181))
+
         if not GPIO_AVAILABLE:
             print("Running in simulation mode - no actual servo control")
             self.servo = None
@@ -183,25 +201,18 @@ class ServoController:
             self.current_position = angle
             return
         
-        # Clamp angle to valid range
-        angle = max(0, min(180, angle))
-        
+        # Clamp to valid range and snap to the nearest whole degree so the
+        # precomputed lookup tables cover every reachable position
+        angle = max(0, min(180, int(round(angle))))
+
         try:
             if self.method == 'gpiozero':
-                # gpiozero uses -1 to 1 range
-                # Convert 0-180 degrees to -1 to 1 range
-                # Formula: value = (angle - 90) / 90.0
-                # 0° -> -1, 90° -> 0, 180° -> 1
-                value = (angle - 90.0) / 90.0
-                value = max(-1.0, min(1.0, value))  # Clamp to -1 to 1
-                self.servo.value = value
+                # gpiozero uses -1 to 1 range (see LUT built in __init__)
+                self.servo.value = self._value_lut[angle]
                 time.sleep(0.1)  # Small delay to allow servo to move
             elif self.method == 'RPi.GPIO':
-                # RPi.GPIO uses duty cycle percentage
-                # Standard servo: 0° = 2.5%, 90° = 7.5%, 180° = 12.5%
-                # Formula: duty_cycle = 2.5 + (angle / 180.0) * 10.0
-                duty_cycle = 2.5 + (angle / 180.0) * 10.0
-                self.servo.ChangeDutyCycle(duty_cycle)
+                # RPi.GPIO uses duty cycle percentage (see LUT in __init__)
+                self.servo.ChangeDutyCycle(self._duty_lut[angle])
                 time.sleep(0.2)  # Give servo time to move to position
                 # Keep PWM running (don't stop it, as that can cause issues)
             
@@ -297,10 +308,14 @@ class ServoController:
                 print(f"Error cleaning up servo: {e}")
 
 
-def check_backend(url):
-    """Check backend endpoint for gate trigger"""
+def check_backend(url, wait=0):
+    """Check backend endpoint for gate trigger
+
+    With wait > 0 the backend holds the response open until a trigger
+    fires (long-polling), so the loop doesn't need a fixed sleep."""
     try:
-        response = requests.get(url, timeout=5)
+        params = {'wait': wait} if wait else None
+        response = SESSION.get(url, params=params, timeout=wait + 5)
         
         # Check if response is successful
         if response.status_code == 200:
@@ -400,8 +415,11 @@ def main():
     try:
         poll_count = 0
         while True:
-            # Check backend for gate trigger
-            has_trigger, message = check_backend(full_url)
+            # Check backend for gate trigger - the backend holds the request
+            # open until a trigger fires (or the wait elapses), so this loop
+            # mostly sits in a blocked read instead of waking every 2 seconds
+            poll_started = time.time()
+            has_trigger, message = check_backend(full_url, wait=LONG_POLL_WAIT)
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             poll_count += 1
             
@@ -427,8 +445,10 @@ def main():
                     else:
                         print(f"[{timestamp}] Polling... (poll #{poll_count}, waiting for trigger)")
             
-            # Wait before next check
-            time.sleep(CHECK_INTERVAL)
+            # Old backends ignore the wait parameter and answer immediately;
+            # keep the original pacing in that case (also rate-limits errors)
+            if time.time() - poll_started < 1:
+                time.sleep(CHECK_INTERVAL)
     
     except KeyboardInterrupt:
         print("\n\nStopping...")